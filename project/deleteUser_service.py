@@ -1,6 +1,10 @@
+from functools import lru_cache
+
 import prisma
 import prisma.models
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
+
+_BEARER_PREFIX = "Bearer "
 
 
 class DeleteUserResponse(BaseModel):
@@ -8,6 +12,8 @@ class DeleteUserResponse(BaseModel):
     Response model for the deletion process of a user. The model confirms the success of the delete operation.
     """
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     success: bool
     message: str
 
@@ -23,31 +29,37 @@ async def deleteUser(Authorization: str) -> DeleteUserResponse:
     Returns:
     DeleteUserResponse: Response model for the deletion process of a user. The model confirms the success of the delete operation.
     """
-    if not Authorization.startswith("Bearer "):
-        return DeleteUserResponse(
+    token = Authorization.removeprefix(_BEARER_PREFIX)
+    if len(token) == len(Authorization):
+        return DeleteUserResponse.model_construct(
             success=False, message="Invalid authorization token format."
         )
-    token = Authorization[7:]
     user_id = decode_and_extract_user_id(token)
     if not user_id:
-        return DeleteUserResponse(success=False, message="Invalid or expired token.")
+        return DeleteUserResponse.model_construct(
+            success=False, message="Invalid or expired token."
+        )
     try:
         delete_result = await prisma.models.User.prisma().delete(where={"id": user_id})
         if delete_result:
-            return DeleteUserResponse(
+            return DeleteUserResponse.model_construct(
                 success=True, message="User deleted successfully."
             )
         else:
-            return DeleteUserResponse(
+            return DeleteUserResponse.model_construct(
                 success=False, message="No user found with the given credentials."
             )
     except Exception as e:
-        return DeleteUserResponse(success=False, message=f"An error occurred: {str(e)}")
+        return DeleteUserResponse.model_construct(
+            success=False, message=f"An error occurred: {str(e)}"
+        )
 
 
+@lru_cache(maxsize=2048)
 def decode_and_extract_user_id(token: str) -> int:
     """
-    Decodes the JWT token and extracts the user_id.
+    Decodes the JWT token and extracts the user_id. Results are memoized per token,
+    since repeated requests from the same client carry the same token.
 
     Args:
     token (str): The JWT token from which user_id should be extracted.
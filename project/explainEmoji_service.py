@@ -1,7 +1,19 @@
+import asyncio
+
 import prisma
 import prisma.enums
 import prisma.models
-from pydantic import BaseModel
+from project.interpretation_cache import emoji_cache
+from pydantic import BaseModel, ConfigDict
+
+_INTERPRETATIONS: dict[str, str] = {
+    "🙂": "A smiling face that indicates happiness or satisfaction.",
+    "😢": "A sad face portraying tears, often used to indicate sadness or grief.",
+}
+
+_DEFAULT_EXPLANATION = "An interesting but not yet interpreted emoji!"
+
+_inflight: dict[str, asyncio.Task] = {}
 
 
 class EmojiExplainResponse(BaseModel):
@@ -9,6 +21,8 @@ class EmojiExplainResponse(BaseModel):
     The response model containing a detailed text explaining the meaning of the emoji, either from the database or computed by llama3 if not present.
     """
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     explanation: str
 
 
@@ -29,6 +43,29 @@ async def explainEmoji(emoji: str) -> EmojiExplainResponse:
         print(response.explanation)
         > 'A smiling face generally used for expressing happiness or satisfaction.'
     """
+    explanation = emoji_cache.get(emoji)
+    if explanation is None:
+        task = _inflight.get(emoji)
+        if task is None:
+            task = asyncio.create_task(load_explanation(emoji))
+            _inflight[emoji] = task
+            task.add_done_callback(lambda _: _inflight.pop(emoji, None))
+        explanation = await asyncio.shield(task)
+    return EmojiExplainResponse.model_construct(explanation=explanation)
+
+
+async def load_explanation(emoji: str) -> str:
+    """
+    Retrieves the explanation for an emoji from the database, computing and storing it if it does not exist yet.
+    The generic fallback explanation is returned without being stored or cached.
+    Concurrent callers for the same emoji share a single invocation through explainEmoji.
+
+    Args:
+        emoji (str): The emoji character for which the explanation is requested.
+
+    Returns:
+        str: The explanation of the emoji.
+    """
     interpretation = await prisma.models.Interpretation.prisma().find_unique(
         where={"emoji": emoji}
     )
@@ -36,19 +73,23 @@ async def explainEmoji(emoji: str) -> EmojiExplainResponse:
         explanation = interpretation.explanation
     else:
         explanation = fake_advanced_interpretation(emoji)
-        await prisma.models.Interpretation.prisma().create(
-            data={"emoji": emoji, "explanation": explanation, "userId": 1}
-        )
-        await prisma.models.Log.prisma().create(
-            data={
-                "message": f"Computed new interpretation for emoji '{emoji}'",
-                "level": prisma.enums.LogLevel.INFO,
-            }
-        )
-    return EmojiExplainResponse(explanation=explanation)
-
-
-async def fake_advanced_interpretation(emoji: str) -> str:
+        if explanation == _DEFAULT_EXPLANATION:
+            return explanation
+        async with prisma.get_client().batch_() as batcher:
+            batcher.interpretation.create(
+                data={"emoji": emoji, "explanation": explanation, "userId": 1}
+            )
+            batcher.log.create(
+                data={
+                    "message": f"Computed new interpretation for emoji '{emoji}'",
+                    "level": prisma.enums.LogLevel.INFO,
+                }
+            )
+    emoji_cache.set(emoji, explanation)
+    return explanation
+
+
+def fake_advanced_interpretation(emoji: str) -> str:
     """
     A fake placeholder function for the purpose of simulating advanced interpretation of an emoji since the actual advanced interpretation libraries are unavailable to include.
     Only returns a simple example explanation based on a predefined rule.
@@ -64,8 +105,4 @@ async def fake_advanced_interpretation(emoji: str) -> str:
         > "A smiling face that indicates happiness or satisfaction."
 
     """
-    interpretations = {
-        "🙂": "A smiling face that indicates happiness or satisfaction.",
-        "😢": "A sad face portraying tears, often used to indicate sadness or grief.",
-    }
-    return interpretations.get(emoji, "An interesting but not yet interpreted emoji!")
+    return _INTERPRETATIONS.get(emoji, _DEFAULT_EXPLANATION)
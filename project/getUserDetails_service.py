@@ -1,6 +1,6 @@
 import prisma
 import prisma.models
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class UserDetailsRequest(BaseModel):
@@ -26,6 +26,8 @@ class UserDetailsResponse(BaseModel):
     Response model for user details. Contains the username and role of the authenticated user.
     """
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     username: str
     role: Role
 
@@ -48,9 +50,7 @@ async def getUserDetails(request: UserDetailsRequest) -> UserDetailsResponse:
         print(details.username, details.role)
     """
     user_id = 1
-    user = await prisma.models.User.prisma().find_unique(
-        where={"id": user_id}, include={"role": True}
-    )
+    user = await prisma.models.User.prisma().find_unique(where={"id": user_id})
     if user is None:
         raise ValueError("No user found with the provided token information.")
     response = UserDetailsResponse(username=user.email, role=user.role)
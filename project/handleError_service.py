@@ -1,10 +1,23 @@
+import asyncio
+import logging
 from datetime import datetime
 from enum import Enum
 from typing import Dict, List, Optional
 
 import prisma
 import prisma.models
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
+
+logger = logging.getLogger(__name__)
+
+_background_tasks: set[asyncio.Task] = set()
+
+_USER_MESSAGE = "There was an internal error, please try again later."
+
+_SUGGESTED_ACTIONS = (
+    "Please check the information provided and try again.",
+    "If the problem persists, contact customer support.",
+)
 
 
 class Role(BaseModel):
@@ -22,6 +35,8 @@ class ErrorResponse(BaseModel):
     This model provides a user-friendly error message and potential corrective actions to the client.
     """
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     user_message: str
     suggested_actions: Optional[List[str]] = None
     reference_code: str
@@ -71,19 +86,39 @@ async def handleError(
 
         print(e_response)
     """
-    await prisma.models.Log.prisma().create(
-        data={
-            "message": f"Error in {module}: {error_message}. Additional Info: {additional_info}",
-            "level": LogLevel.ERROR,
-            "createdAt": timestamp,
-        }
-    )
-    error_response = ErrorResponse(
-        user_message="There was an internal error, please try again later.",
-        suggested_actions=[
-            "Please check the information provided and try again.",
-            "If the problem persists, contact customer support.",
-        ],
+    log_data = {
+        "message": error_message,
+        "module": module,
+        "level": LogLevel.ERROR,
+        "createdAt": timestamp,
+    }
+    if additional_info is not None:
+        log_data["additionalInfo"] = prisma.Json(additional_info)
+    task = asyncio.create_task(prisma.models.Log.prisma().create(data=log_data))
+    _background_tasks.add(task)
+    task.add_done_callback(_on_log_written)
+    error_response = ErrorResponse.model_construct(
+        user_message=_USER_MESSAGE,
+        suggested_actions=list(_SUGGESTED_ACTIONS),
         reference_code="ERR" + str(int(timestamp.timestamp())),
     )
     return error_response
+
+
+def _on_log_written(task: asyncio.Task) -> None:
+    """
+    Releases a finished background log task and reports it if the insert failed.
+
+    Args:
+        task (asyncio.Task): The completed Log.create task.
+    """
+    _background_tasks.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.exception("Failed to write error log entry", exc_info=task.exception())
+
+
+async def wait_for_pending_logs() -> None:
+    """
+    Waits for every background log write that is still in flight, so none are lost when the database client disconnects.
+    """
+    await asyncio.gather(*_background_tasks, return_exceptions=True)
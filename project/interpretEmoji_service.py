@@ -1,6 +1,7 @@
 import prisma
 import prisma.models
-from pydantic import BaseModel
+from project.interpretation_cache import emoji_cache
+from pydantic import BaseModel, ConfigDict
 
 
 class EmojiInterpretationResponse(BaseModel):
@@ -8,6 +9,8 @@ class EmojiInterpretationResponse(BaseModel):
     This model outlines the expected response from the API, which is a simple string explaining the significance of the emoji.
     """
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     interpretation: str
 
 
@@ -27,14 +30,18 @@ async def interpretEmoji(emoji: str) -> EmojiInterpretationResponse:
         print(result.interpretation)
         > "A smiley face that indicates happiness."
     """
+    explanation = emoji_cache.get(emoji)
+    if explanation is not None:
+        return EmojiInterpretationResponse.model_construct(interpretation=explanation)
     interpretation_record = await prisma.models.Interpretation.prisma().find_unique(
         where={"emoji": emoji}
     )
     if interpretation_record:
-        return EmojiInterpretationResponse(
+        emoji_cache.set(emoji, interpretation_record.explanation)
+        return EmojiInterpretationResponse.model_construct(
             interpretation=interpretation_record.explanation
         )
     else:
-        return EmojiInterpretationResponse(
+        return EmojiInterpretationResponse.model_construct(
             interpretation="No interpretation available."
         )
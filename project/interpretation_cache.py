@@ -0,0 +1,57 @@
+import time
+from collections import OrderedDict
+from typing import Optional
+
+
+class InterpretationCache:
+    """
+    A small in-process LRU cache with a time-to-live, mapping an emoji to its stored explanation.
+    Interpretations are effectively static, so serving repeat lookups from memory saves a database round trip.
+    """
+
+    def __init__(self, maxsize: int = 4096, ttl: float = 3600.0) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[str, tuple[float, str]] = OrderedDict()
+
+    def get(self, emoji: str) -> Optional[str]:
+        """
+        Returns the cached explanation for the emoji, or None if it is missing or expired.
+
+        Args:
+            emoji (str): The emoji character to look up.
+
+        Returns:
+            Optional[str]: The cached explanation, if present and still fresh.
+        """
+        entry = self._entries.get(emoji)
+        if entry is None:
+            return None
+        expires_at, explanation = entry
+        if expires_at < time.monotonic():
+            del self._entries[emoji]
+            return None
+        self._entries.move_to_end(emoji)
+        return explanation
+
+    def set(self, emoji: str, explanation: str) -> None:
+        """
+        Stores the explanation for the emoji, evicting the least recently used entry when full.
+
+        Args:
+            emoji (str): The emoji character used as the cache key.
+            explanation (str): The explanation to cache.
+        """
+        self._entries[emoji] = (time.monotonic() + self.ttl, explanation)
+        self._entries.move_to_end(emoji)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """
+        Removes every entry from the cache.
+        """
+        self._entries.clear()
+
+
+emoji_cache = InterpretationCache()
@@ -1,8 +1,13 @@
+import asyncio
+
 import bcrypt
 import jwt
 import prisma
 import prisma.models
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
+
+_JWT_SECRET = "YOUR_SECRET_KEY"
+_JWT_ALGORITHM = "HS256"
 
 
 class LoginResponse(BaseModel):
@@ -10,6 +15,8 @@ class LoginResponse(BaseModel):
     Response model post successful authentication. It contains the JWT token used for subsequent requests.
     """
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     jwt_token: str
 
 
@@ -29,12 +36,14 @@ async def loginUser(email: str, password: str) -> LoginResponse:
         # Returns instance of LoginResponse with a valid jwt_token if credentials are correct, otherwise raises an Exception.
     """
     user = await prisma.models.User.prisma().find_unique(where={"email": email})
-    if user and bcrypt.checkpw(
-        password.encode("utf-8"), user.hashedPassword.encode("utf-8")
+    if user and await asyncio.get_running_loop().run_in_executor(
+        None,
+        bcrypt.checkpw,
+        password.encode("utf-8"),
+        user.hashedPassword.encode("utf-8"),
     ):
         payload = {"user_id": user.id, "role": user.role.name}
-        secret = "YOUR_SECRET_KEY"
-        token = jwt.encode(payload, secret, algorithm="HS256")
-        return LoginResponse(jwt_token=token)
+        token = jwt.encode(payload, _JWT_SECRET, algorithm=_JWT_ALGORITHM)
+        return LoginResponse.model_construct(jwt_token=token)
     else:
         raise Exception("Invalid login credentials")
@@ -1,8 +1,11 @@
+import asyncio
+
 import bcrypt
 import prisma
 import prisma.enums
+import prisma.errors
 import prisma.models
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class Role(BaseModel):
@@ -20,6 +23,8 @@ class UserRegistrationResponse(BaseModel):
     This model defines the structure of the response after a successful user registration. It returns the registered user's details except the password.
     """
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     id: int
     username: str
     email: str
@@ -43,24 +48,23 @@ async def registerUser(
         UserRegistrationResponse: This model defines the structure of the response after a successful user registration,
                                   It returns the registered user's details except the password.
     """
-    existing_user = await prisma.models.User.prisma().find_first(
-        where={"OR": [{"email": email}, {"username": username}]}
-    )
-    if existing_user:
-        raise ValueError("A user with the same email or username already exists.")
     salt = bcrypt.gensalt()
-    hashed_password = bcrypt.hashpw(password.encode("utf-8"), salt).decode("utf-8")
-    user = await prisma.models.User.prisma().create(
-        data={
-            "username": username,
-            "email": email,
-            "hashedPassword": hashed_password,
-            "role": prisma.enums.Role.USER,
-        }
-    )
-    return UserRegistrationResponse(
+    hashed_password = (
+        await asyncio.get_running_loop().run_in_executor(
+            None, bcrypt.hashpw, password.encode("utf-8"), salt
+        )
+    ).decode("utf-8")
+    try:
+        user = await prisma.models.User.prisma().create(
+            data={
+                "username": username,
+                "email": email,
+                "hashedPassword": hashed_password,
+                "role": prisma.enums.Role.USER,
+            }
+        )
+    except prisma.errors.UniqueViolationError:
+        raise ValueError("A user with the same email or username already exists.")
+    return UserRegistrationResponse.model_construct(
         id=user.id, username=user.username, email=user.email, role=Role.USER
-    )  # TODO(autogpt): Cannot access attribute "username" for class "User"
-
-
-#     Attribute "username" is unknown. reportAttributeAccessIssue
+    )
@@ -1,7 +1,10 @@
+import asyncio
 import logging
+import os
 from contextlib import asynccontextmanager
 from datetime import datetime
 from typing import Dict, Optional
+from urllib.parse import parse_qs, urlparse
 
 import project.deleteUser_service
 import project.explainEmoji_service
@@ -12,25 +15,43 @@ import project.loginUser_service
 import project.registerUser_service
 import project.updateUser_service
 from fastapi import FastAPI
-from fastapi.encoders import jsonable_encoder
-from fastapi.responses import Response
+from fastapi.responses import ORJSONResponse, Response
 from prisma import Prisma
 
 logger = logging.getLogger(__name__)
 
 db_client = Prisma(auto_register=True)
 
+DEFAULT_WARMUP_CONNECTIONS = 2
+
+
+def warmup_connection_count() -> int:
+    """
+    Returns how many pooled connections to open at startup, taken from the connection_limit
+    parameter of DATABASE_URL so the warm-up matches the configured pool size.
+    """
+    query = urlparse(os.environ.get("DATABASE_URL", "")).query
+    limits = parse_qs(query).get("connection_limit")
+    if limits and limits[0].isdigit():
+        return int(limits[0])
+    return DEFAULT_WARMUP_CONNECTIONS
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     await db_client.connect()
+    await asyncio.gather(
+        *(db_client.query_raw("SELECT 1") for _ in range(warmup_connection_count()))
+    )
     yield
+    await project.handleError_service.wait_for_pending_logs()
     await db_client.disconnect()
 
 
 app = FastAPI(
     title="emoji-explainer",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     description="create a single endpoint that takes in an emoji and explains what it means. Use groq and llama3 for the explaination",
 )
 
@@ -51,11 +72,7 @@ async def api_patch_updateUser(
         logger.exception("Error processing request")
         res = dict()
         res["error"] = str(e)
-        return Response(
-            content=jsonable_encoder(res),
-            status_code=500,
-            media_type="application/json",
-        )
+        return ORJSONResponse(res, status_code=500)
 
 
 @app.post("/api/error", response_model=project.handleError_service.ErrorResponse)
@@ -78,11 +95,7 @@ async def api_post_handleError(
         logger.exception("Error processing request")
         res = dict()
         res["error"] = str(e)
-        return Response(
-            content=jsonable_encoder(res),
-            status_code=500,
-            media_type="application/json",
-        )
+        return ORJSONResponse(res, status_code=500)
 
 
 @app.post(
@@ -102,11 +115,7 @@ async def api_post_interpretEmoji(
         logger.exception("Error processing request")
         res = dict()
         res["error"] = str(e)
-        return Response(
-            content=jsonable_encoder(res),
-            status_code=500,
-            media_type="application/json",
-        )
+        return ORJSONResponse(res, status_code=500)
 
 
 @app.post("/users/login", response_model=project.loginUser_service.LoginResponse)
@@ -123,11 +132,7 @@ async def api_post_loginUser(
         logger.exception("Error processing request")
         res = dict()
         res["error"] = str(e)
-        return Response(
-            content=jsonable_encoder(res),
-            status_code=500,
-            media_type="application/json",
-        )
+        return ORJSONResponse(res, status_code=500)
 
 
 @app.get(
@@ -146,11 +151,7 @@ async def api_get_getUserDetails(
         logger.exception("Error processing request")
         res = dict()
         res["error"] = str(e)
-        return Response(
-            content=jsonable_encoder(res),
-            status_code=500,
-            media_type="application/json",
-        )
+        return ORJSONResponse(res, status_code=500)
 
 
 @app.post(
@@ -169,11 +170,7 @@ async def api_post_explainEmoji(
         logger.exception("Error processing request")
         res = dict()
         res["error"] = str(e)
-        return Response(
-            content=jsonable_encoder(res),
-            status_code=500,
-            media_type="application/json",
-        )
+        return ORJSONResponse(res, status_code=500)
 
 
 @app.delete(
@@ -192,11 +189,7 @@ async def api_delete_deleteUser(
         logger.exception("Error processing request")
         res = dict()
         res["error"] = str(e)
-        return Response(
-            content=jsonable_encoder(res),
-            status_code=500,
-            media_type="application/json",
-        )
+        return ORJSONResponse(res, status_code=500)
 
 
 @app.post(
@@ -216,8 +209,4 @@ async def api_post_registerUser(
         logger.exception("Error processing request")
         res = dict()
         res["error"] = str(e)
-        return Response(
-            content=jsonable_encoder(res),
-            status_code=500,
-            media_type="application/json",
-        )
+        return ORJSONResponse(res, status_code=500)
@@ -1,6 +1,6 @@
 import prisma
 import prisma.models
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class UpdateUserProfileResponse(BaseModel):
@@ -8,6 +8,8 @@ class UpdateUserProfileResponse(BaseModel):
     This model returns the status of the update operation, indicating whether it was successful or not.
     """
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     success: bool
     message: str
 
@@ -17,30 +19,33 @@ async def updateUser(username: str, email: str) -> UpdateUserProfileResponse:
     This endpoint allows the user to update their profile information like username or email. It requires JWT token authentication and changes are saved to the user database.
 
     Args:
-    username (str): New username that the user wishes to update to.
+    username (str): Username of the account whose email should be updated.
     email (str): New email address for the user account.
 
     Returns:
     UpdateUserProfileResponse: This model returns the status of the update operation, indicating whether it was successful or not.
     """
     try:
-        existing_user = await prisma.models.User.prisma().find_unique(
-            where={"email": email}
+        users = await prisma.models.User.prisma().find_many(
+            where={"OR": [{"email": email}, {"username": username}]}, take=2
         )
+        existing_user = next((u for u in users if u.email == email), None)
         if existing_user:
-            return UpdateUserProfileResponse(
+            return UpdateUserProfileResponse.model_construct(
                 success=False, message="Email is already in use by another account."
             )
-        user = await prisma.models.User.prisma().find_unique(where={"email": username})
+        user = next((u for u in users if u.username == username), None)
         if not user:
-            return UpdateUserProfileResponse(success=False, message="User not found.")
+            return UpdateUserProfileResponse.model_construct(
+                success=False, message="User not found."
+            )
         updated_user = await prisma.models.User.prisma().update(
             where={"id": user.id}, data={"email": email}
         )
-        return UpdateUserProfileResponse(
+        return UpdateUserProfileResponse.model_construct(
             success=True, message="User profile updated successfully."
         )
     except Exception as e:
-        return UpdateUserProfileResponse(
+        return UpdateUserProfileResponse.model_construct(
             success=False, message=f"An error occurred: {str(e)}"
         )
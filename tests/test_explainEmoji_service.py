@@ -0,0 +1,151 @@
+import asyncio
+
+import prisma
+import prisma.models
+import pytest
+
+import project.explainEmoji_service as service
+from project.interpretation_cache import emoji_cache
+
+
+class FakeInterpretationActions:
+    def __init__(self, gate: asyncio.Event, error: Exception | None = None):
+        self.gate = gate
+        self.error = error
+        self.lookups = 0
+
+    async def find_unique(self, where):
+        self.lookups += 1
+        await self.gate.wait()
+        if self.error is not None:
+            raise self.error
+        return None
+
+
+class FakeBatchActions:
+    def __init__(self, batch):
+        self.batch = batch
+
+    def create(self, data):
+        self.batch.pending.append(data)
+
+
+class FakeBatch:
+    def __init__(self):
+        self.pending = []
+        self.commits = 0
+        self.interpretation = FakeBatchActions(self)
+        self.log = FakeBatchActions(self)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        self.commits += 1
+
+
+class FakeClient:
+    def __init__(self):
+        self.batch = FakeBatch()
+
+    def batch_(self):
+        return self.batch
+
+
+@pytest.fixture(autouse=True)
+def reset_state():
+    emoji_cache.clear()
+    service._inflight.clear()
+    yield
+    emoji_cache.clear()
+    service._inflight.clear()
+
+
+def install_fakes(monkeypatch, error=None):
+    gate = asyncio.Event()
+    actions = FakeInterpretationActions(gate, error)
+    client = FakeClient()
+    monkeypatch.setattr(prisma.models.Interpretation, "prisma", lambda: actions)
+    monkeypatch.setattr(prisma, "get_client", lambda: client)
+    return gate, actions, client
+
+
+def test_concurrent_misses_share_one_load(monkeypatch):
+    async def scenario():
+        gate, actions, client = install_fakes(monkeypatch)
+        tasks = [asyncio.create_task(service.explainEmoji("🙂")) for _ in range(10)]
+        await asyncio.sleep(0)
+        gate.set()
+        responses = await asyncio.gather(*tasks)
+        return actions, client, responses
+
+    actions, client, responses = asyncio.run(scenario())
+    expected = service.fake_advanced_interpretation("🙂")
+    assert [r.explanation for r in responses] == [expected] * 10
+    assert actions.lookups == 1
+    assert client.batch.commits == 1
+    assert len(client.batch.pending) == 2
+    assert service._inflight == {}
+    assert emoji_cache.get("🙂") == expected
+
+
+def test_load_error_reaches_every_waiter(monkeypatch):
+    async def scenario():
+        gate, actions, _ = install_fakes(monkeypatch, RuntimeError("db down"))
+        tasks = [asyncio.create_task(service.explainEmoji("🙂")) for _ in range(5)]
+        await asyncio.sleep(0)
+        gate.set()
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        return actions, results
+
+    actions, results = asyncio.run(scenario())
+    assert actions.lookups == 1
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert service._inflight == {}
+    assert emoji_cache.get("🙂") is None
+
+
+def test_failed_load_is_retried_on_next_call(monkeypatch):
+    async def scenario():
+        gate, actions, _ = install_fakes(monkeypatch, RuntimeError("db down"))
+        gate.set()
+        with pytest.raises(RuntimeError):
+            await service.explainEmoji("🙂")
+        actions.error = None
+        response = await service.explainEmoji("🙂")
+        return actions, response
+
+    actions, response = asyncio.run(scenario())
+    assert actions.lookups == 2
+    assert response.explanation == service.fake_advanced_interpretation("🙂")
+
+
+def test_cancelled_waiter_does_not_cancel_shared_load(monkeypatch):
+    async def scenario():
+        gate, actions, client = install_fakes(monkeypatch)
+        first = asyncio.create_task(service.explainEmoji("🙂"))
+        second = asyncio.create_task(service.explainEmoji("🙂"))
+        await asyncio.sleep(0)
+        first.cancel()
+        await asyncio.sleep(0)
+        gate.set()
+        response = await second
+        return actions, client, first, response
+
+    actions, client, first, response = asyncio.run(scenario())
+    assert first.cancelled()
+    assert actions.lookups == 1
+    assert client.batch.commits == 1
+    assert response.explanation == service.fake_advanced_interpretation("🙂")
+
+
+def test_cached_explanation_skips_database(monkeypatch):
+    async def scenario():
+        _, actions, _ = install_fakes(monkeypatch)
+        emoji_cache.set("🙂", "cached")
+        response = await service.explainEmoji("🙂")
+        return actions, response
+
+    actions, response = asyncio.run(scenario())
+    assert response.explanation == "cached"
+    assert actions.lookups == 0
@@ -0,0 +1,55 @@
+import pytest
+
+import project.interpretation_cache
+from project.interpretation_cache import InterpretationCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(project.interpretation_cache.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_get_returns_stored_explanation(clock):
+    cache = InterpretationCache()
+    cache.set("🙂", "smile")
+    assert cache.get("🙂") == "smile"
+    assert cache.get("😢") is None
+
+
+def test_entry_expires_after_ttl(clock):
+    cache = InterpretationCache(ttl=10)
+    cache.set("🙂", "smile")
+    clock[0] += 9
+    assert cache.get("🙂") == "smile"
+    clock[0] += 2
+    assert cache.get("🙂") is None
+    assert len(cache._entries) == 0
+
+
+def test_set_refreshes_ttl(clock):
+    cache = InterpretationCache(ttl=10)
+    cache.set("🙂", "smile")
+    clock[0] += 8
+    cache.set("🙂", "smile again")
+    clock[0] += 8
+    assert cache.get("🙂") == "smile again"
+
+
+def test_least_recently_used_entry_is_evicted(clock):
+    cache = InterpretationCache(maxsize=2)
+    cache.set("a", "1")
+    cache.set("b", "2")
+    assert cache.get("a") == "1"
+    cache.set("c", "3")
+    assert cache.get("a") == "1"
+    assert cache.get("b") is None
+    assert cache.get("c") == "3"
+
+
+def test_clear_removes_all_entries(clock):
+    cache = InterpretationCache()
+    cache.set("a", "1")
+    cache.clear()
+    assert cache.get("a") is None